@@ -10,7 +10,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, ClassVar
 import re
 
-from .config import AI_API_KEYS, SCHEDULE_CONFIG
+from .config import get_ai_keys, SCHEDULE_CONFIG
 from .exceptions import AIProcessorError, AllKeysFailedError
 from . import ai_client_gemini as ai_client
 
@@ -40,7 +40,7 @@ class AIProcessor:
         Initializes the AI processor.
         It uses a single pool of API keys and rotates through them on failure.
         """
-        self.api_keys: List[str] = AI_API_KEYS
+        self.api_keys: List[str] = list(get_ai_keys())
         if not self.api_keys:
             raise AIProcessorError("No GEMINI_ API keys found in the environment. Please set at least one GEMINI_... key.")
 
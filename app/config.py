@@ -1,12 +1,23 @@
+import functools
 import os
+import types
 from dotenv import load_dotenv
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Mapping, Tuple
 
-# Carrega variáveis de ambiente de um arquivo .env
-load_dotenv()
+# Carrega variáveis de ambiente de um arquivo .env (uma única vez por processo).
+# Em produção (APP_ENV=production) o ambiente já vem do systemd/docker e o .env é ignorado.
+_DOTENV_LOADED = False
+
+def _ensure_dotenv() -> None:
+    global _DOTENV_LOADED
+    if not _DOTENV_LOADED and os.environ.get('APP_ENV') != 'production':
+        load_dotenv()
+        _DOTENV_LOADED = True
+
+_ensure_dotenv()
 
 # --- Ordem de processamento dos feeds ---
-PIPELINE_ORDER: List[str] = [
+PIPELINE_ORDER: Tuple[str, ...] = (
     'as_es_laliga',
     'as_es_copa',
     'as_es_laliga_hypermotion',
@@ -19,10 +30,10 @@ PIPELINE_ORDER: List[str] = [
     'bbc_football',
     'fox_sports_nfl',
     'fox_sports_nba',
-]
+)
 
 # --- Feeds RSS ---
-RSS_FEEDS: Dict[str, Dict[str, Any]] = {
+RSS_FEEDS: Mapping[str, Dict[str, Any]] = types.MappingProxyType({
     'as_es_laliga': {
         'urls': ['https://aprenderpoker.site/feeds/as_es/primera/rss'],
         'category': 'futebol-internacional',
@@ -83,7 +94,7 @@ RSS_FEEDS: Dict[str, Dict[str, Any]] = {
         'category': 'outros-esportes',
         'source_name': 'Fox Sports',
     },
-}
+})
 
 # --- HTTP ---
 USER_AGENT = (
@@ -93,21 +104,14 @@ USER_AGENT = (
 )
 
 # --- Configuração da IA ---
-def _load_ai_keys() -> List[str]:
+@functools.cache
+def get_ai_keys() -> List[str]:
     """
     Lê todas as chaves GEMINI_* do ambiente e as retorna em uma lista única e ordenada.
+    A leitura é feita na primeira chamada (e não no import) e o resultado fica em cache.
     """
-    keys = {}
-    for key, value in os.environ.items():
-        if value and key.startswith('GEMINI_'):
-            keys[key] = value
-    
     # Sort by key name for predictable order (e.g., GEMINI_KEY_1, GEMINI_KEY_2)
-    sorted_key_names = sorted(keys.keys())
-    
-    return [keys[k] for k in sorted_key_names]
-
-AI_API_KEYS = _load_ai_keys()
+    return [os.environ[k] for k in sorted(k for k in os.environ if k.startswith('GEMINI_') and os.environ[k])]
 
 # Caminho para o prompt universal na raiz do projeto
 PROMPT_FILE_PATH = os.path.join(
@@ -138,12 +142,17 @@ PILAR_POSTS: List[str] = [
 ]
 
 # IDs das categorias no WordPress (ajuste os IDs conforme o seu WP)
-WORDPRESS_CATEGORIES: Dict[str, int] = {
+WORDPRESS_CATEGORIES: Mapping[str, int] = types.MappingProxyType({
     'futebol': 8,
     'futebol-internacional': 9,
     'outros-esportes': 10,
     'noticias': 31,
-}
+})
+
+# Mesmo mapa com as chaves em minúsculas, calculado uma única vez no import
+WORDPRESS_CATEGORIES_LOWER: Mapping[str, int] = types.MappingProxyType(
+    {k.lower(): v for k, v in WORDPRESS_CATEGORIES.items()}
+)
 
 # --- Sinônimos de Categorias ---
 CATEGORY_ALIASES: Dict[str, str] = {
@@ -254,11 +254,27 @@ def run_pipeline_cycle():
                         else:
                             logger.info("No valid featured image to upload. The post will not have a highlight.")
 
+                        # Alt text is sent with the upload itself, saving one request per image
+                        focus_kw = rewritten_data.get("focus_keyphrase", "")
+                        # The AI is asked to provide a dict like: { "filename.jpg": "alt text" }
+                        alt_map = rewritten_data.get("image_alt_texts", {})
+
+                        def _alt_text_for(image_url):
+                            # Extract filename from the original URL to match keys in alt_map
+                            filename = urlparse(image_url.rstrip('/')).path.split('/')[-1]
+                            # Try to get specific alt text from AI, fallback to a generic one
+                            alt_text = alt_map.get(filename)
+                            if not alt_text and focus_kw:
+                                alt_text = f"{focus_kw} — foto ilustrativa"
+                            return alt_text or ""
+
                         uploaded_src_map = {}
                         uploaded_id_map = {}
                         logger.info(f"Attempting to upload {len(urls_to_upload)} image(s).")
-                        for url in urls_to_upload:
-                            media = wp_client.upload_media_from_url(url, title)
+                        uploaded_media = wp_client.upload_media_batch(
+                            [(url, _alt_text_for(url)) for url in urls_to_upload]
+                        )
+                        for url, media in zip(urls_to_upload, uploaded_media):
                             if media and media.get("source_url") and media.get("id"):
                                 # Normalize URL to handle potential trailing slashes as keys
                                 k = url.rstrip('/')
@@ -325,25 +341,6 @@ def run_pipeline_cycle():
                         if not featured_media_id and uploaded_id_map:
                             featured_media_id = next(iter(uploaded_id_map.values()), None)
 
-                        # 5.3: Set alt text for uploaded images
-                        focus_kw = rewritten_data.get("focus_keyphrase", "")
-                        # The AI is asked to provide a dict like: { "filename.jpg": "alt text" }
-                        alt_map = rewritten_data.get("image_alt_texts", {})
-
-                        if uploaded_id_map and (alt_map or focus_kw):
-                            logger.info("Setting alt text for uploaded images.")
-                            for original_url, media_id in uploaded_id_map.items():
-                                # Extract filename from the original URL to match keys in alt_map
-                                filename = urlparse(original_url).path.split('/')[-1]
-
-                                # Try to get specific alt text from AI, fallback to a generic one
-                                alt_text = alt_map.get(filename)
-                                if not alt_text and focus_kw:
-                                    alt_text = f"{focus_kw} — foto ilustrativa"
-
-                                if alt_text:
-                                    wp_client.set_media_alt_text(media_id, alt_text)
-
                         # 5.4: Prepare Yoast meta, including canonical URL to original source
                         yoast_meta = rewritten_data.get('yoast_meta', {})
                         yoast_meta['_yoast_wpseo_canonical'] = article_url_to_process
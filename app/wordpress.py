@@ -1,27 +1,259 @@
+import base64
 import logging
+import os
+import posixpath
 import requests
 import time
 import json
 import re 
-from typing import Dict, Any, Optional, List
-from urllib.parse import urlparse
+import functools
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Callable, Iterable, Mapping
+from urllib.parse import urlsplit
+from requests.adapters import HTTPAdapter
+from requests.auth import AuthBase
+from urllib3.util.retry import Retry
+from .config import WORDPRESS_CATEGORIES, WORDPRESS_CATEGORIES_LOWER
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Worker threads used to fetch the remaining pages of a paginated listing
+# once the first page has told us how many there are.
+PAGE_FETCH_WORKERS = 10
+
+# Worker threads used by upload_media_batch.
+MEDIA_UPLOAD_WORKERS = 8
+
+# Worker threads used to create tags one by one when the batch endpoint can't.
+TAG_CREATE_WORKERS = 8
+
+# Tag/category name -> ID resolutions are persisted here on close() so the next
+# process can skip the lookups. Each entry keeps the time it was last resolved
+# against WordPress, and entries older than the TTL are discarded on load.
+TERM_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'wpclient_tags.json')
+TERM_CACHE_TTL_SECONDS = 24 * 3600
+
+# How long the full category listing is reused before being fetched again.
+CATEGORIES_CACHE_TTL_SECONDS = 600
+
+# Client-side ceiling on requests to WordPress: steady requests per second and burst size.
+# When the server reports fewer than RATE_LIMIT_LOW_REMAINING requests left in its
+# X-RateLimit-Remaining header, the rate is halved (down to 1 rps) until it recovers.
+RATE_LIMIT_RPS = 8.0
+RATE_LIMIT_BURST = 16
+RATE_LIMIT_LOW_REMAINING = 20
+
+# Maximum number of sub-requests WordPress accepts in one batch call.
+BATCH_MAX_REQUESTS = 25
+
+# Search term -> related posts results kept by find_related_posts (LRU with a TTL).
+RELATED_CACHE_SIZE = 1024
+RELATED_CACHE_TTL_SECONDS = 1800
+
+# A successful test_category_creation() is reused for this long.
+HEALTH_CHECK_TTL_SECONDS = 3600
+
+# Characters that are not alphanumeric, whitespace, or hyphen
+_SLUG_STRIP = re.compile(r'[^\w\s-]', re.UNICODE)
+# Runs of whitespace, underscores and hyphens
+_SLUG_COLLAPSE = re.compile(r'[\s_-]+', re.UNICODE)
+
+# Separator for comma-separated tag lists, swallowing surrounding whitespace
+_COMMA_SPLIT = re.compile(r'\s*,\s*')
+
+@functools.lru_cache(maxsize=4096)
 def _slugify(name: str) -> str:
     """Creates a simple, WordPress-compatible slug from a string."""
     s = name.strip().lower()
     # Remove characters that are not alphanumeric, whitespace, or hyphen
-    s = re.sub(r'[^\w\s-]', '', s, flags=re.UNICODE)
+    s = _SLUG_STRIP.sub('', s)
     # Replace whitespace and underscores with a hyphen
-    s = re.sub(r'[\s_-]+', '-', s, flags=re.UNICODE)
+    s = _SLUG_COLLAPSE.sub('-', s)
     # Strip leading/trailing hyphens and limit length
     return s.strip('-')[:190] or 'tag'
 
+def _dumps_json(payload: Any, pretty: bool = False) -> bytes:
+    """Serializes a JSON request body (or log dump), using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(payload, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(payload).encode('utf-8')
+
+def _loads_json(r: requests.Response) -> Any:
+    """
+    Parses a response body, using orjson when it is installed. Both paths read
+    `r.content`, and invalid JSON raises requests' JSONDecodeError either way, so
+    callers keep catching RequestException.
+    """
+    try:
+        if orjson is not None:
+            return orjson.loads(r.content)
+        return json.loads(r.content)
+    except json.JSONDecodeError as e:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos) from e
+
+def _cache_term(cache: Dict[str, int], name: str, term_id: int) -> None:
+    """Remembers a term ID under both its lowercased name and its slug."""
+    cache[name.strip().lower()] = term_id
+    slug = _slugify(name)
+    if slug != 'tag' or name.strip().lower() == 'tag':  # 'tag' is _slugify's fallback, not a real slug
+        cache[slug] = term_id
+
+def _cached_term_id(cache: Dict[str, int], name: str) -> Optional[int]:
+    """Returns the cached ID for a term name, matching by lowercased name or slug."""
+    term_id = cache.get(name.strip().lower())
+    return term_id if term_id is not None else cache.get(_slugify(name))
+
+def _build_adapter() -> HTTPAdapter:
+    """
+    Builds a pooled adapter that retries transient failures with exponential backoff.
+
+    POST is left out of the status/read retries: a 502 after WordPress has already
+    committed would otherwise create a duplicate post or term. Connection failures,
+    where the request never reached the server, are still retried for every method.
+    """
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        # Random extra delay so parallel workers throttled together don't retry in lockstep
+        backoff_jitter=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset(['GET', 'HEAD', 'PUT', 'DELETE']),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    # Each session gets its own adapter. The WordPress session only ever targets a
+    # handful of hosts, but each may see many requests in flight (page fetches,
+    # batch uploads), so keep few pools with many sockets each.
+    return HTTPAdapter(pool_connections=4, pool_maxsize=32, pool_block=False, max_retries=retry)
+
+class _TermCache(dict):
+    """
+    {key: term ID} map that remembers when each entry was last resolved against WordPress.
+
+    Storing an entry stamps it with the current time; entries restored from disk keep
+    their original stamp, so persisting them again does not make them look fresh.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.resolved_at: Dict[str, float] = {}
+
+    def __setitem__(self, key: str, term_id: int) -> None:
+        super().__setitem__(key, term_id)
+        self.resolved_at[key] = time.time()
+
+    def load(self, entries: Mapping[str, Any], default_resolved_at: float) -> None:
+        """Restores `{key: [id, resolved_at]}` entries still within the TTL."""
+        now = time.time()
+        for key, value in entries.items():
+            # Files written before per-entry stamps hold bare IDs
+            term_id, resolved_at = value if isinstance(value, list) else (value, default_resolved_at)
+            if now - resolved_at <= TERM_CACHE_TTL_SECONDS:
+                super().__setitem__(key, int(term_id))
+                self.resolved_at[key] = resolved_at
+
+    def retain_ids(self, valid_ids: Iterable[int]) -> None:
+        """Drops the entries whose term ID is not among `valid_ids` (deleted or merged terms)."""
+        valid = set(valid_ids)
+        for key in [k for k, term_id in self.items() if term_id not in valid]:
+            del self[key]
+            self.resolved_at.pop(key, None)
+
+    def dump(self) -> Dict[str, list]:
+        return {key: [term_id, self.resolved_at[key]] for key, term_id in self.items()}
+
+class _SizedStream:
+    """
+    File-like wrapper around a streamed download that exposes its length, so requests
+    sends it with a Content-Length header instead of chunked transfer encoding.
+    """
+
+    def __init__(self, raw: Any, length: int):
+        self._raw = raw
+        self.len = length
+
+    def read(self, size: int = -1) -> bytes:
+        return self._raw.read(size)
+
+class _TokenBucket:
+    """Thread-safe token bucket; acquire() blocks until a request may be sent."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.base_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def observe(self, headers: Mapping[str, str]) -> None:
+        """Slows down while the server says its rate-limit budget is almost spent."""
+        try:
+            remaining = int(headers.get('X-RateLimit-Remaining'))
+        except (TypeError, ValueError):
+            return
+        with self._lock:
+            if remaining < RATE_LIMIT_LOW_REMAINING:
+                self.rate = max(1.0, self.rate / 2)
+            else:
+                self.rate = self.base_rate
+
+class _PrecomputedBasicAuth(AuthBase):
+    """
+    Basic auth whose header is encoded once. Being set as `session.auth`, it also keeps
+    requests from looking up (and letting ~/.netrc override) credentials per request.
+    """
+
+    def __init__(self, user: str, password: str):
+        token = base64.b64encode(f"{user}:{password}".encode('utf-8')).decode('ascii')
+        self._header = f'Basic {token}'
+
+    def __call__(self, r: requests.PreparedRequest) -> requests.PreparedRequest:
+        r.headers['Authorization'] = self._header
+        return r
+
+class _RateLimitedSession(requests.Session):
+    """Session whose requests all go through a shared token bucket."""
+
+    def __init__(self, limiter: _TokenBucket):
+        super().__init__()
+        self.rate_limiter = limiter
+
+    def request(self, method, url, *args, **kwargs):
+        self.rate_limiter.acquire()
+        r = super().request(method, url, *args, **kwargs)
+        self.rate_limiter.observe(r.headers)
+        return r
+
 class WordPressClient:
     """A client for interacting with the WordPress REST API."""
 
-    def __init__(self, config: Dict[str, str], categories_map: Dict[str, int]):
+    # (api_url, user) -> time.monotonic() of its last successful test_category_creation(),
+    # shared by all clients in the process
+    _health_checks: Dict[tuple[str, Optional[str]], float] = {}
+
+    def __init__(self, config: Mapping[str, str], categories_map: Mapping[str, int]):
         base_url = (config.get('url') or "").rstrip('/')
         if not base_url:
             raise ValueError("WORDPRESS_URL is not configured.")
@@ -32,42 +264,193 @@ class WordPressClient:
         else:
             self.api_url = base_url
 
+        self._domain = urlsplit(self.api_url).netloc
+        # REST batch framework endpoint (WP 5.6+); disabled after the first 404
+        self._batch_url = f"{self.api_url.rsplit('/wp/v2', 1)[0]}/batch/v1"
+        self._batch_supported = True
+
         self.user = config.get('user')
         self.password = config.get('password')
         
-        self.session = requests.Session()
+        # Every call to WordPress waits for a token, so bursts (batch runs, concurrent
+        # page fetches) don't trip the server's or a caching plugin's 429s
+        self._rate_limiter = _TokenBucket(rate=RATE_LIMIT_RPS, capacity=RATE_LIMIT_BURST)
+        self.session = _RateLimitedSession(self._rate_limiter)
+        # Size the connection pool so concurrent requests reuse warm TLS sockets,
+        # and let urllib3 retry transient failures for every endpoint
+        adapter = _build_adapter()
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # Images are downloaded from third-party hosts, so they get their own
+        # session without the WordPress credentials, and their own adapter so
+        # CDN hosts never evict the WordPress host's warm pool
+        self._download_session = requests.Session()
+        download_adapter = _build_adapter()
+        self._download_session.mount('https://', download_adapter)
+        self._download_session.mount('http://', download_adapter)
         if self.user and self.password:
-            self.session.auth = (self.user, self.password)
-        self.session.headers.update({'User-Agent': 'VocMoney-Pipeline/1.0'})
+            # Build the Basic auth header once instead of letting requests re-encode it per request
+            self.session.auth = _PrecomputedBasicAuth(self.user, self.password)
+        self.session.headers.update({
+            'User-Agent': 'VocMoney-Pipeline/1.0',
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive',
+        })
+        self._warned_uncompressed = False
+
+        self.categories_map: Mapping[str, int]
+        if categories_map is WORDPRESS_CATEGORIES:
+            # The configured map already has a precomputed lowercase index; it is
+            # read-only and never modified here, so share it instead of copying
+            self.categories_map = WORDPRESS_CATEGORIES_LOWER
+        else:
+            self.categories_map = {k.lower(): v for k, v in categories_map.items()}
 
-        self.categories_map = {k.lower(): v for k, v in categories_map.items()}
+        # Caches of resolved term IDs, keyed by lowercased name and slug
+        self._tag_id_cache = _TermCache()
+        self._cat_id_cache = _TermCache()
+        # Full category listing of the site, see _get_categories_map()
+        self._categories_cache: Optional[Dict[str, int]] = None
+        self._categories_cache_ts: float = 0.0
+        # (url, params) -> (etag, items, total_pages) of listings answered with an ETag
+        self._etag_cache: Dict[tuple, tuple[str, Any, Optional[int]]] = {}
+        # (term, limit) -> (fetched_at, results), most recently used last
+        self._related_cache: "OrderedDict[tuple[str, int], tuple[float, List[Dict[str, str]]]]" = OrderedDict()
+        # time.time() of the last most-used-tags prefetch, carried over by the disk cache
+        self._tags_prefetched_at: float = 0.0
+        self._load_term_cache()
+        # Seed the tag cache with the most used tags on first use, unless the loaded
+        # cache holds a prefetch that is still within the TTL
+        self._tags_prefetched = time.time() - self._tags_prefetched_at <= TERM_CACHE_TTL_SECONDS
         logger.info("WordPress client initialized.")
 
+    def _load_term_cache(self) -> None:
+        """Loads the term IDs persisted by a previous run against the same site that are still fresh."""
+        try:
+            with open(TERM_CACHE_PATH, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read term cache '{TERM_CACHE_PATH}': {e}")
+            return
+
+        if not isinstance(data, dict) or data.get('api_url') != self.api_url:
+            return
+        saved_at = data.get('saved_at', 0)
+        self._tags_prefetched_at = float(data.get('tags_prefetched_at') or 0)
+        self._tag_id_cache.load(data.get('tags') or {}, saved_at)
+        self._cat_id_cache.load(data.get('categories') or {}, saved_at)
+        logger.info(f"Loaded {len(self._tag_id_cache)} tag and {len(self._cat_id_cache)} category IDs from cache.")
+
+    def _save_term_cache(self) -> None:
+        """Persists the resolved term IDs so they survive process restarts."""
+        if not self._tag_id_cache and not self._cat_id_cache:
+            return
+        data = {
+            'api_url': self.api_url,
+            'saved_at': time.time(),
+            'tags_prefetched_at': self._tags_prefetched_at,
+            'tags': self._tag_id_cache.dump(),
+            'categories': self._cat_id_cache.dump(),
+        }
+        try:
+            os.makedirs(os.path.dirname(TERM_CACHE_PATH), exist_ok=True)
+            with open(TERM_CACHE_PATH, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+        except OSError as e:
+            logger.warning(f"Could not write term cache '{TERM_CACHE_PATH}': {e}")
+
+    def _post_json(self, url: str, payload: Any, **kwargs) -> requests.Response:
+        """POSTs `payload` as a JSON body serialized with `_dumps_json`."""
+        return self.session.post(url, data=_dumps_json(payload), headers={'Content-Type': 'application/json'}, **kwargs)
+
+    @staticmethod
+    def _json_body(r: requests.Response) -> Any:
+        """Parses a response body once, returning None if it is not valid JSON."""
+        try:
+            return _loads_json(r)
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _existing_term_id(body: Dict[str, Any]) -> Optional[int]:
+        """Extracts the existing term's ID that WP includes in a `term_exists` error."""
+        try:
+            return int(body["data"]["term_id"])
+        except (KeyError, TypeError, ValueError):
+            return None
+
     def get_domain(self) -> str:
-        """Extracts the domain from the WordPress URL."""
+        """Returns the domain of the WordPress URL (parsed once in __init__)."""
+        return self._domain
+
+    def _bulk_lookup_terms(self, endpoint: str, names: List[str],
+                           cache: Optional[Dict[str, int]] = None) -> tuple[Dict[str, int], List[str]]:
+        """
+        Looks up several terms (tags or categories) with a single `?slug=a,b,c` request.
+
+        Names already present in `cache` are answered without any HTTP call, and the
+        ones found remotely are added to it. Returns a `{name: id}` map of the terms
+        that already exist and the list of names that were not found.
+        """
+        found: Dict[str, int] = {}
+        if cache is not None:
+            for n in names:
+                term_id = _cached_term_id(cache, n)
+                if term_id is not None:
+                    found[n] = term_id
+        pending = [n for n in names if n not in found]
+        if not pending:
+            return found, []
+        slugs = {_slugify(n): n for n in pending}
+        params = {"slug": ",".join(slugs), "per_page": 100, "_fields": "id,name,slug"}
+
         try:
-            return urlparse(self.api_url).netloc
-        except Exception:
-            return ""
+            r = self.session.get(endpoint, params=params, timeout=20)
+            r.raise_for_status()
+            by_name = {n.strip().lower(): n for n in pending}
+            for item in _loads_json(r):
+                name = slugs.get(item.get('slug')) or by_name.get(item.get('name', '').strip().lower())
+                if name and name not in found:
+                    found[name] = int(item['id'])
+                    if cache is not None:
+                        _cache_term(cache, name, found[name])
+        except requests.RequestException as e:
+            logger.error(f"Error looking up terms at '{endpoint}': {e}")
+
+        return found, [n for n in names if n not in found]
+
+    def _prefetch_tags(self) -> None:
+        """Seeds the tag cache with the 100 most used tags in a single request."""
+        self._tags_prefetched = True
+        try:
+            items, _ = self._get_listing(f"{self.api_url}/tags",
+                                         {"per_page": 100, "orderby": "count", "order": "desc", "_fields": "id,name,slug"},
+                                         timeout=20)
+            for item in items:
+                self._tag_id_cache[item['name'].strip().lower()] = int(item['id'])
+                self._tag_id_cache[item['slug']] = int(item['id'])
+            self._tags_prefetched_at = time.time()
+        except requests.RequestException as e:
+            logger.warning(f"Could not prefetch tags: {e}")
 
     def _get_existing_tag_id(self, name: str) -> Optional[int]:
-        """Searches for an existing tag by name or slug and returns its ID."""
-        slug = _slugify(name)
+        """Looks up an existing tag by its slug and returns its ID."""
+        cached = _cached_term_id(self._tag_id_cache, name)
+        if cached is not None:
+            return cached
         tags_endpoint = f"{self.api_url}/tags"
-        params = {"search": name, "per_page": 100}
+        # Exact, indexed slug lookup instead of a broad ?search= query
+        params = {"slug": _slugify(name), "_fields": "id,name,slug"}
 
         try:
-            r = self.session.get(tags_endpoint, params=params, timeout=20)
-            r.raise_for_status()
-            items = r.json()
-            
-            # WordPress search can be broad, so we verify the match
-            for item in items:
-                if item.get('name', '').strip().lower() == name.strip().lower():
-                    return int(item['id'])
-            for item in items:
-                if item.get('slug') == slug:
-                    return int(item['id'])
+            items, _ = self._get_listing(tags_endpoint, params, timeout=20)
+            if items:
+                tag_id = int(items[0]['id'])
+                _cache_term(self._tag_id_cache, name, tag_id)
+                return tag_id
         except requests.RequestException as e:
             logger.error(f"Error searching for tag '{name}': {e}")
         
@@ -79,15 +462,22 @@ class WordPressClient:
         payload = {"name": name, "slug": _slugify(name)}
         
         try:
-            r = self.session.post(tags_endpoint, json=payload, timeout=20)
+            r = self._post_json(tags_endpoint, payload, params={"_fields": "id"}, timeout=20)
             
             if r.status_code in (200, 201):
-                tag_id = int(r.json()['id'])
+                tag_id = int(_loads_json(r)['id'])
+                _cache_term(self._tag_id_cache, name, tag_id)
                 logger.info(f"Created new tag '{name}' with ID {tag_id}.")
                 return tag_id
             
             # Handle race condition where tag was created between search and post
-            if r.status_code == 400 and isinstance(r.json(), dict) and r.json().get("code") == "term_exists":
+            body = self._json_body(r) if r.status_code == 400 else None
+            if isinstance(body, dict) and body.get("code") == "term_exists":
+                tag_id = self._existing_term_id(body)
+                if tag_id is not None:
+                    _cache_term(self._tag_id_cache, name, tag_id)
+                    logger.info(f"Tag '{name}' already exists with ID {tag_id}.")
+                    return tag_id
                 logger.warning(f"Tag '{name}' already exists (race condition). Re-fetching ID.")
                 return self._get_existing_tag_id(name)
             
@@ -99,124 +489,378 @@ class WordPressClient:
 
         return None
 
+    def _batch(self, sub_requests: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+        """
+        Sends up to 25 sub-requests in one call to the REST batch endpoint (WP 5.6+).
+        Returns the sub-responses in order, or None if batching is unavailable or failed.
+        """
+        if not self._batch_supported:
+            return None
+        try:
+            r = self._post_json(self._batch_url,
+                                {"requests": sub_requests, "validation": "require-all-validate"},
+                                timeout=60)
+            if r.status_code == 404:
+                logger.info("WordPress batch endpoint not available; falling back to single requests.")
+                self._batch_supported = False
+                return None
+            r.raise_for_status()
+            body = _loads_json(r)
+            if body.get("failed"):
+                logger.warning(f"WordPress batch request failed {body.get('failed')}.")
+                return None
+            return body.get("responses")
+        except (requests.RequestException, ValueError, AttributeError) as e:
+            logger.error(f"Error sending WordPress batch request: {e}")
+            return None
+
+    def _create_tags_batch(self, names: List[str]) -> Dict[str, int]:
+        """
+        Creates several tags through the batch endpoint and returns `{name: id}` for those
+        that succeeded (or already existed). Names left out are created one by one by the caller.
+        """
+        created: Dict[str, int] = {}
+        for i in range(0, len(names), BATCH_MAX_REQUESTS):
+            chunk = names[i:i + BATCH_MAX_REQUESTS]
+            responses = self._batch([
+                {"method": "POST", "path": "/wp/v2/tags", "body": {"name": n, "slug": _slugify(n)}}
+                for n in chunk
+            ])
+            if not responses:
+                break
+            for name, resp in zip(chunk, responses):
+                body = resp.get("body")
+                tag_id = None
+                if resp.get("status") in (200, 201) and isinstance(body, dict):
+                    tag_id = int(body["id"])
+                elif isinstance(body, dict) and body.get("code") == "term_exists":
+                    tag_id = self._existing_term_id(body)
+                if tag_id is not None:
+                    _cache_term(self._tag_id_cache, name, tag_id)
+                    created[name] = tag_id
+        if created:
+            logger.info(f"Created/resolved {len(created)} tag(s) in batch: {created}")
+        return created
+
     def _ensure_tag_ids(self, tags: List[Any], max_tags: int = 10) -> List[int]:
         """Converts a list of tag names/IDs into a list of integer IDs, creating tags if necessary."""
         if not tags:
             return []
+        # Fast path: the caller already passed resolved IDs
+        if all(isinstance(t, int) for t in tags):
+            return list(dict.fromkeys(tags))[:max_tags]
 
-        # Normalize input (handles strings, ints, and comma-separated strings)
-        norm_tags: List[str] = []
+        # Normalize, deduplicate and limit in one pass: ints are kept as IDs, strings
+        # (possibly comma-separated) are split into names, numeric ones becoming IDs.
+        # Names are deduplicated case-insensitively, as "Zelda" and "zelda" are the
+        # same WordPress tag.
+        cleaned_tags: List[Any] = []
+        seen = set()
         for t in tags:
+            if not t:
+                continue
             if isinstance(t, int):
-                norm_tags.append(str(t))
+                parts: Iterable[Any] = (t,)
             elif isinstance(t, str):
-                norm_tags.extend([p.strip() for p in t.split(',') if p.strip()])
-        
-        # Deduplicate and limit
-        cleaned_tags = list(dict.fromkeys(norm_tags))[:max_tags]
+                parts = _COMMA_SPLIT.split(t.strip()) if ',' in t else (t.strip(),)
+            else:
+                continue
+            for p in parts:
+                if isinstance(p, str) and p.isdigit():
+                    p = int(p)
+                key = p.lower() if isinstance(p, str) else p
+                if p and key not in seen:
+                    seen.add(key)
+                    cleaned_tags.append(p)
+            if len(cleaned_tags) >= max_tags:
+                cleaned_tags = cleaned_tags[:max_tags]
+                break
         
+        # Resolve every tag name in one request; only the missing ones get created
+        names = [t for t in cleaned_tags if isinstance(t, str) and len(t) >= 2]
+        if names and not self._tags_prefetched:
+            self._prefetch_tags()
+        existing, missing = self._bulk_lookup_terms(f"{self.api_url}/tags", names, cache=self._tag_id_cache)
+        if len(missing) > 1:
+            existing.update(self._create_tags_batch(missing))
+        # Whatever the batch did not resolve is created one per request, concurrently
+        unresolved = [n for n in missing if n not in existing]
+        if len(unresolved) == 1:
+            existing[unresolved[0]] = self._create_tag(unresolved[0])
+        elif unresolved:
+            with ThreadPoolExecutor(max_workers=min(TAG_CREATE_WORKERS, len(unresolved))) as ex:
+                existing.update(zip(unresolved, ex.map(self._create_tag, unresolved)))
+
         tag_ids: List[int] = []
         for tag_name in cleaned_tags:
-            if tag_name.isdigit():
-                tag_ids.append(int(tag_name))
+            if isinstance(tag_name, int):
+                tag_ids.append(tag_name)
             elif len(tag_name) >= 2:
-                tag_id = self._get_existing_tag_id(tag_name) or self._create_tag(tag_name)
+                tag_id = existing.get(tag_name)
                 if tag_id:
                     tag_ids.append(tag_id)
         
+        # Spelling variants ("Real Madrid" / "real-madrid") can resolve to the same ID
+        tag_ids = list(dict.fromkeys(tag_ids))
         logger.info(f"Resolved tags {tags} to IDs: {tag_ids}")
         return tag_ids
 
-    def _list_categories_es(self) -> dict[str,int]:
-        by_name, page = {}, 1
-        while True:
-            r = self.session.get(f"{self.api_url}/categories",
-                                 params={"per_page":100, "page":page, "_fields":"id,name"},
+    def _check_compressed(self, r: requests.Response) -> None:
+        """Logs once if WordPress answers a listing without gzip/deflate compression."""
+        if self._warned_uncompressed or r.headers.get('Content-Encoding') in ('gzip', 'deflate'):
+            return
+        self._warned_uncompressed = True
+        logger.warning(f"WordPress sent an uncompressed listing ({r.url}); enable gzip on the server to cut transfer size.")
+
+    @staticmethod
+    def _total_pages(r: requests.Response) -> Optional[int]:
+        """Reads the X-WP-TotalPages header, returning None if it is missing or invalid."""
+        try:
+            return int(r.headers.get('X-WP-TotalPages'))
+        except (TypeError, ValueError):
+            return None
+
+    def _get_listing(self, url: str, params: Dict[str, Any], timeout: int) -> tuple[Any, Optional[int]]:
+        """
+        GETs a WP collection, returning `(items, total_pages)`.
+
+        When the server tagged an earlier identical request with an ETag, it is sent back as
+        If-None-Match and a 304 answer reuses the stored items instead of a new body.
+        """
+        key = (url, tuple(sorted(params.items())))
+        cached = self._etag_cache.get(key)
+        kwargs = {"headers": {"If-None-Match": cached[0]}} if cached else {}
+        r = self.session.get(url, params=params, timeout=timeout, **kwargs)
+        if cached and r.status_code == 304:
+            return cached[1], cached[2]
+        r.raise_for_status()
+        self._check_compressed(r)
+        items, total_pages = _loads_json(r), self._total_pages(r)
+        etag = r.headers.get('ETag')
+        if etag:
+            self._etag_cache[key] = (etag, items, total_pages)
+        return items, total_pages
+
+    def _fetch_all_pages(self, fetch_page: Callable[[int], tuple], per_page: int = 100,
+                         max_pages: Optional[int] = None) -> List[List[Dict[str, Any]]]:
+        """
+        Fetches every page of a paginated WP collection, returning the items of each page in order.
+
+        `fetch_page(page)` must return `(items, total_pages)`, with `items` set to None on failure.
+        Page 1 is fetched alone to learn X-WP-TotalPages; the remaining pages are then fetched
+        concurrently. Stops at the first empty or failed page.
+        """
+        items, total_pages = fetch_page(1)
+        if not items:
+            return []
+        pages = [items]
+
+        if total_pages is not None:
+            last_page = min(total_pages, max_pages) if max_pages else total_pages
+            if last_page > 1:
+                with ThreadPoolExecutor(max_workers=min(PAGE_FETCH_WORKERS, last_page - 1)) as ex:
+                    for items, _ in ex.map(fetch_page, range(2, last_page + 1)):
+                        if not items:
+                            break
+                        pages.append(items)
+        else:
+            # No pagination header (e.g. stripped by a proxy): walk pages until a short one
+            page = 1
+            while len(items) >= per_page and (not max_pages or page < max_pages):
+                page += 1
+                items, _ = fetch_page(page)
+                if not items:
+                    break
+                pages.append(items)
+
+        return pages
+
+    def _fetch_categories_page(self, page: int) -> tuple[list[dict], Optional[int]]:
+        return self._get_listing(f"{self.api_url}/categories",
+                                 {"per_page":100, "page":page, "_fields":"id,name"},
                                  timeout=30)
-            r.raise_for_status()
-            items = r.json()
-            if not items: break
+
+    def _list_categories_es(self) -> dict[str,int]:
+        by_name = {}
+        for items in self._fetch_all_pages(self._fetch_categories_page):
             for c in items:
                 by_name[c["name"].strip().lower()] = int(c["id"])
-            if len(items) < 100: break
-            page += 1
         return by_name
 
+    def _get_categories_map(self, force: bool = False) -> dict[str,int]:
+        """Returns the site's {lowercased name: id} category map, re-listed at most every few minutes."""
+        stale = time.monotonic() - self._categories_cache_ts >= CATEGORIES_CACHE_TTL_SECONDS
+        if force or self._categories_cache is None or stale:
+            self._categories_cache = self._list_categories_es()
+            self._categories_cache_ts = time.monotonic()
+            # A fresh listing is authoritative: forget IDs of categories that no longer exist
+            if self._categories_cache:
+                self._cat_id_cache.retain_ids(self._categories_cache.values())
+        return self._categories_cache
+
+    def _remember_category(self, name: str, cat_id: int) -> None:
+        """Records a newly resolved category in both the ID cache and the cached listing."""
+        _cache_term(self._cat_id_cache, name, cat_id)
+        if self._categories_cache is not None:
+            self._categories_cache[name.strip().lower()] = cat_id
+
     def _create_category_es(self, name: str) -> int | None:
-        r = self.session.post(f"{self.api_url}/categories", json={"name": name}, timeout=30)
+        r = self._post_json(f"{self.api_url}/categories", {"name": name}, params={"_fields": "id"}, timeout=30)
         if r.status_code in (200,201):
-            return int(r.json()["id"])
-        if r.status_code == 400 and isinstance(r.json(), dict) and r.json().get("code") == "term_exists":
+            cat_id = int(_loads_json(r)["id"])
+            self._remember_category(name, cat_id)
+            return cat_id
+        body = self._json_body(r) if r.status_code == 400 else None
+        if isinstance(body, dict) and body.get("code") == "term_exists":
+            cat_id = self._existing_term_id(body)
+            if cat_id is not None:
+                self._remember_category(name, cat_id)
+                return cat_id
             q = self.session.get(f"{self.api_url}/categories",
                                  params={"search": name, "per_page":100, "_fields":"id,name"},
                                  timeout=30)
             q.raise_for_status()
-            for c in q.json():
+            for c in _loads_json(q):
                 if c["name"].strip().lower() == name.strip().lower():
-                    return int(c["id"])
+                    cat_id = int(c["id"])
+                    self._remember_category(name, cat_id)
+                    return cat_id
         r.raise_for_status()
         return None
 
+    def test_category_creation(self) -> tuple[bool, str]:
+        """
+        Checks that the configured user can create (and delete) categories.
+
+        Each run costs two write requests, so it is skipped when SKIP_WP_HEALTHCHECK
+        is set and reuses a success from the last hour for the same site and user.
+        """
+        if os.getenv('SKIP_WP_HEALTHCHECK'):
+            return True, "skipped (SKIP_WP_HEALTHCHECK is set)"
+        # Only a check done against this same site and account may be reused
+        key = (self.api_url, self.user)
+        last_ok = WordPressClient._health_checks.get(key)
+        if last_ok is not None and time.monotonic() - last_ok < HEALTH_CHECK_TTL_SECONDS:
+            return True, "cached ok"
+
+        name = f"Test Categoria {int(time.time())}"
+        try:
+            r = self._post_json(f"{self.api_url}/categories", {"name": name}, params={"_fields": "id"}, timeout=30)
+            r.raise_for_status()
+            cat_id = int(_loads_json(r)["id"])
+            d = self.session.delete(f"{self.api_url}/categories/{cat_id}", params={"force": "true", "_fields": "deleted"}, timeout=30)
+            d.raise_for_status()
+        except requests.RequestException as e:
+            body = f" Response body: {e.response.text}" if e.response is not None else ""
+            logger.error(f"Category creation test failed: {e}")
+            return False, f"Could not create/delete test category '{name}': {e}.{body}"
+
+        WordPressClient._health_checks[key] = time.monotonic()
+        return True, f"Created and deleted test category '{name}' (ID {cat_id})."
+
     def resolve_category_names_to_ids(self, names: list[str]) -> list[int]:
         names = list(dict.fromkeys([n.strip() for n in names if n and n.strip()]))
-        existing = self._list_categories_es()
         ids = []
         for n in names:
             key = n.lower()
-            if key in existing:
-                ids.append(existing[key])
-            else:
-                new_id = self._create_category_es(n)
-                if new_id:
-                    ids.append(new_id)
-                    existing[key] = new_id
-        return ids
+            # Configured map first, then the site listing (re-listed every few minutes, so
+            # it corrects IDs of deleted/merged categories), then IDs resolved earlier
+            # (slug spellings, categories created since the listing)
+            cat_id = self.categories_map.get(key)
+            if cat_id is None:
+                try:
+                    cat_id = self._get_categories_map().get(key)
+                except requests.RequestException as e:
+                    logger.warning(f"Could not list categories, using cached IDs: {e}")
+                if cat_id is not None:
+                    _cache_term(self._cat_id_cache, n, cat_id)
+            if cat_id is None:
+                cat_id = _cached_term_id(self._cat_id_cache, n)
+            if cat_id is None:
+                cat_id = self._create_category_es(n)
+            if cat_id:
+                ids.append(cat_id)
+        # Different names can resolve to the same term; dedupe without losing order
+        return list(dict.fromkeys(ids))
+
+    def preload_categories(self, names: Iterable[str]) -> None:
+        """
+        Resolves (creating if needed) the union of category names for a whole batch of
+        articles up front, so later per-article resolutions are served from the cache.
+        """
+        self.resolve_category_names_to_ids(list(names))
 
-    def upload_media_from_url(self, image_url: str, alt_text: str = "", max_attempts: int = 3) -> Optional[Dict[str, Any]]:
+    def upload_media_from_url(self, image_url: str, alt_text: str = "") -> Optional[Dict[str, Any]]:
         """
-        Downloads an image and uploads it to WordPress with a retry mechanism.
+        Downloads an image and uploads it to WordPress, setting its alt text in the same request.
+        Transient network errors are retried by the sessions' adapters.
         """
-        last_err = None
-        for attempt in range(1, max_attempts + 1):
+        # Everything derived from the URL alone is computed before any I/O
+        # Sanitize filename (urlsplit's path already excludes the query string)
+        filename = posixpath.basename(urlsplit(image_url).path) or "image.jpg"
+        media_endpoint = f"{self.api_url}/media"
+        # Only the fields callers use; the full object carries every generated size.
+        # The body is the raw file, so alt_text rides in the query string (WP reads
+        # request args from there too) instead of a second POST to /media/<id>.
+        params = {"_fields": "id,source_url"}
+        if alt_text:
+            params["alt_text"] = alt_text
+
+        try:
+            # 1. Download the image with a reasonable timeout, streaming the body
+            img_response = self._download_session.get(image_url, timeout=25, stream=True)
             try:
-                # 1. Download the image with a reasonable timeout
-                img_response = requests.get(image_url, timeout=25)
                 img_response.raise_for_status()
                 content_type = img_response.headers.get('Content-Type', 'image/jpeg')
-                # Sanitize filename
-                filename = (urlparse(image_url).path.split('/')[-1] or "image.jpg").split("?")[0]
 
                 # 2. Upload to WordPress
-                media_endpoint = f"{self.api_url}/media"
                 headers = {
                     'Content-Disposition': f'attachment; filename="{filename}"',
                     'Content-Type': content_type,
                 }
-                wp_response = self.session.post(media_endpoint, headers=headers, data=img_response.content, timeout=40)
-                wp_response.raise_for_status()
-                logger.info(f"Successfully uploaded image: {image_url}")
-                return wp_response.json() # Success
-
-            except (requests.Timeout, requests.ConnectionError) as e:
-                last_err = e
-                logger.warning(f"Upload attempt {attempt}/{max_attempts} for '{image_url}' failed with network error: {e}. Retrying in {2*attempt}s...")
-                time.sleep(2 * attempt)  # Simple backoff
-            except Exception as e:
-                last_err = e
-                logger.error(f"Upload of '{image_url}' failed with non-retriable error: {e}")
-                break # Don't retry on WP errors (4xx, 5xx) or other issues
-
-        logger.error(f"Final failure to upload image '{image_url}' after {attempt} attempt(s): {last_err}")
-        return None
+                content_length = img_response.headers.get('Content-Length')
+                if content_length and content_length.isdigit() and not img_response.headers.get('Content-Encoding'):
+                    # Pipe the download straight into the upload instead of buffering it
+                    body = _SizedStream(img_response.raw, int(content_length))
+                else:
+                    body = img_response.content
+                wp_response = self.session.post(media_endpoint, headers=headers, data=body,
+                                                params=params, timeout=40)
+            finally:
+                img_response.close()
+            wp_response.raise_for_status()
+            logger.info(f"Successfully uploaded image: {image_url}")
+            return _loads_json(wp_response) # Success
+        except Exception as e:
+            logger.error(f"Failed to upload image '{image_url}': {e}")
+            return None
+
+    def upload_media_batch(self, items: List[tuple[str, str]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Uploads several images concurrently, so one download overlaps another's upload.
+
+        Args:
+            items: A list of `(image_url, alt_text)` pairs.
+
+        Returns:
+            The media object (or None on failure) for each item, in the same order.
+        """
+        if not items:
+            return []
+        with ThreadPoolExecutor(max_workers=min(MEDIA_UPLOAD_WORKERS, len(items))) as ex:
+            return list(ex.map(lambda item: self.upload_media_from_url(*item), items))
 
     def set_media_alt_text(self, media_id: int, alt_text: str) -> bool:
-        """Sets the alt text for a media item in WordPress."""
+        """
+        Changes the alt text of an existing media item in WordPress.
+        New uploads should pass `alt_text` to upload_media_from_url() instead.
+        """
         if not alt_text:
             return False
         try:
             endpoint = f"{self.api_url}/media/{media_id}"
             payload = {"alt_text": alt_text}
-            r = self.session.post(endpoint, json=payload, timeout=20)
+            r = self._post_json(endpoint, payload, params={"_fields": "id"}, timeout=20)
             r.raise_for_status()
             logger.info(f"Successfully set alt text for media ID {media_id}.")
             return True
@@ -230,17 +874,29 @@ class WordPressClient:
         """Searches for posts on the site and returns their title and URL."""
         if not term:
             return []
+        # Articles often share the same entities, so recent searches are reused
+        key = (term.strip().lower(), limit)
+        cached = self._related_cache.get(key)
+        if cached and time.monotonic() - cached[0] < RELATED_CACHE_TTL_SECONDS:
+            self._related_cache.move_to_end(key)
+            return list(cached[1])
         try:
-            endpoint = f"{self.api_url}/search"
-            params = {"search": term, "per_page": limit, "_embed": "self"}
+            # Query /posts directly with _fields so WP skips the _embed expansion
+            endpoint = f"{self.api_url}/posts"
+            params = {"search": term, "per_page": limit, "_fields": "title,link"}
             resp = self.session.get(endpoint, params=params, timeout=15)
             resp.raise_for_status()
-            # The 'url' in the search result is the API URL, we need the 'link' from the embedded post object
-            return [{"title": i.get("title", ""), "url": i.get("_embedded", {}).get("self", [{}])[0].get("link", "")} for i in resp.json()]
+            posts = [{"title": i.get("title", {}).get("rendered", ""), "url": i.get("link", "")} for i in _loads_json(resp)]
         except requests.RequestException as e:
             logger.error(f"Error searching for related posts with term '{term}': {e}")
             return []
 
+        self._related_cache[key] = (time.monotonic(), posts)
+        self._related_cache.move_to_end(key)
+        if len(self._related_cache) > RELATED_CACHE_SIZE:
+            self._related_cache.popitem(last=False)
+        return list(posts)
+
     def create_post(self, payload: Dict[str, Any]) -> Optional[int]:
         """Creates a new post in WordPress."""
         try:
@@ -255,46 +911,80 @@ class WordPressClient:
                 if isinstance(cat_input, (int, str)):
                     cat_input = [cat_input]
                 
-                # Convert names to IDs
-                category_names = [str(c) for c in cat_input if isinstance(c, str) and not c.isdigit()]
-                category_ids = [int(c) for c in cat_input if isinstance(c, int) or (isinstance(c, str) and c.isdigit())]
-                
-                if category_names:
-                    resolved_ids = self.resolve_category_names_to_ids(category_names)
-                    category_ids.extend(resolved_ids)
+                if all(isinstance(c, int) for c in cat_input):
+                    # Fast path: already IDs (what the pipeline sends), nothing to resolve
+                    category_ids = list(cat_input)
+                else:
+                    # Split IDs from names in one pass, then convert the names to IDs
+                    category_ids = []
+                    category_names = []
+                    for c in cat_input:
+                        if isinstance(c, int):
+                            category_ids.append(c)
+                        elif isinstance(c, str):
+                            if c.isdigit():
+                                category_ids.append(int(c))
+                            else:
+                                category_names.append(c)
+
+                    if category_names:
+                        category_ids.extend(self.resolve_category_names_to_ids(category_names))
                 
-                # Remove duplicates and assign back to payload
-                payload['categories'] = list(set(category_ids))
+                # Remove duplicates (keeping order: WP treats the first as primary) and assign back
+                payload['categories'] = list(dict.fromkeys(category_ids))
 
             posts_endpoint = f"{self.api_url}/posts"
             payload.setdefault('status', 'publish')
 
-            # Log a summary of the payload to avoid overly long logs
-            try:
-                logger.info(
-                    "WP payload: title_len=%d content_len=%d cat=%s tags=%s",
-                    len(payload.get('title', '')),
-                    len(payload.get('content', '')),
-                    payload.get('categories'),
-                    payload.get('tags')
-                )
-                if logger.isEnabledFor(logging.DEBUG):
-                    log_payload = json.dumps(payload, indent=2, ensure_ascii=False)
-                    logger.debug(f"Sending full payload to WordPress:\n{log_payload}")
-            except Exception as log_e:
-                logger.warning(f"Could not serialize payload for logging: {log_e}")
-
-            response = self.session.post(posts_endpoint, json=payload, timeout=60)
+            # Log a summary of the payload to avoid overly long logs; skipped
+            # entirely (including the len() arguments) when INFO is disabled
+            if logger.isEnabledFor(logging.INFO):
+                try:
+                    logger.info(
+                        "WP payload: title_len=%d content_len=%d cat=%s tags=%s",
+                        len(payload.get('title', '')),
+                        len(payload.get('content', '')),
+                        payload.get('categories'),
+                        payload.get('tags')
+                    )
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Sending full payload to WordPress:\n%s",
+                                     _dumps_json(payload, pretty=True).decode('utf-8'))
+                except Exception as log_e:
+                    logger.warning(f"Could not serialize payload for logging: {log_e}")
+
+            response = self._post_json(posts_endpoint, payload, params={"_fields": "id"}, timeout=60)
             
             if not response.ok:
                 logger.error(f"WordPress post creation failed with status {response.status_code}: {response.text}")
                 response.raise_for_status()
 
-            return response.json().get('id')
+            return _loads_json(response).get('id')
         except requests.RequestException as e:
             logger.error(f"Failed to create WordPress post: {e}", exc_info=False)
             return None
 
+    def _fetch_posts_page(self, page: int, fields_str: str, per_page: int = 100) -> tuple[Optional[List[Dict[str, Any]]], Optional[int]]:
+        """Fetches one page of published posts. Returns (None, None) on error."""
+        endpoint = f"{self.api_url}/posts"
+        params = {
+            "status": "publish",
+            "per_page": per_page,
+            "page": page,
+            "_fields": fields_str,
+        }
+        try:
+            logger.info(f"Fetching page {page} of published posts...")
+            r = self.session.get(endpoint, params=params, timeout=30)
+            r.raise_for_status()
+            self._check_compressed(r)
+            return _loads_json(r), self._total_pages(r)
+        except requests.RequestException as e:
+            logger.error(f"Error fetching published posts (page {page}): {e}")
+            if e.response is not None:
+                logger.error(f"Response body: {e.response.text}")
+            return None, None
+
     def get_published_posts(self, fields: List[str], max_posts: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Fetches published posts, handling pagination, with an optional limit.
@@ -303,48 +993,18 @@ class WordPressClient:
             fields: A list of fields to retrieve for each post.
             max_posts: Optional limit on the total number of posts to fetch.
         """
-        all_posts = []
-        page = 1
-        per_page = 100
-        
+        # A small max_posts is served by one short page instead of a full one
+        per_page = min(100, max_posts) if max_posts else 100
         fields_str = ','.join(fields)
+        # Only request as many pages as needed to satisfy max_posts
+        max_pages = -(-max_posts // per_page) if max_posts else None
 
-        while True:
-            # Exit if we have reached the desired number of posts
-            if max_posts and len(all_posts) >= max_posts:
-                logger.info(f"Reached max_posts limit of {max_posts}. Stopping fetch.")
-                break
-
-            endpoint = f"{self.api_url}/posts"
-            params = {
-                "status": "publish",
-                "per_page": per_page,
-                "page": page,
-                "_fields": fields_str,
-            }
-            try:
-                logger.info(f"Fetching page {page} of published posts...")
-                r = self.session.get(endpoint, params=params, timeout=30)
-                r.raise_for_status()
-                
-                posts = r.json()
-                if not posts:
-                    logger.info("No more posts found. Finished fetching.")
-                    break
-                
-                all_posts.extend(posts)
-                
-                if len(posts) < per_page:
-                    logger.info(f"Last page reached ({len(posts)} posts). Finished fetching.")
-                    break
-                    
-                page += 1
-
-            except requests.RequestException as e:
-                logger.error(f"Error fetching published posts (page {page}): {e}")
-                if e.response is not None:
-                    logger.error(f"Response body: {e.response.text}")
-                break
+        pages = self._fetch_all_pages(
+            lambda page: self._fetch_posts_page(page, fields_str, per_page),
+            per_page=per_page,
+            max_pages=max_pages,
+        )
+        all_posts = [post for posts in pages for post in posts]
         
         # Trim the list to the exact number if max_posts is set
         if max_posts:
@@ -353,6 +1013,22 @@ class WordPressClient:
         logger.info(f"Successfully fetched a total of {len(all_posts)} posts.")
         return all_posts
 
+    def _fetch_tags_chunk(self, chunk: List[int]) -> List[Dict[str, Any]]:
+        """Fetches id/name for up to 100 tag IDs. Returns an empty list on error."""
+        params = {
+            "include": ",".join(map(str, chunk)),
+            "per_page": 100, # Ensure we get all requested items in the chunk
+            "_fields": "id,name"
+        }
+        try:
+            logger.info(f"Fetching names for {len(chunk)} tag IDs...")
+            r = self.session.get(f"{self.api_url}/tags", params=params, timeout=30)
+            r.raise_for_status()
+            return _loads_json(r)
+        except requests.RequestException as e:
+            logger.error(f"Error fetching tag details: {e}")
+            return []
+
     def get_tags_map_by_ids(self, tag_ids: List[int]) -> Dict[int, str]:
         """ 
         Fetches tag details from a list of IDs and returns a map of {id: name}.
@@ -362,33 +1038,22 @@ class WordPressClient:
             return {}
 
         tag_map = {}
-        unique_ids = list(set(tag_ids))
-        endpoint = f"{self.api_url}/tags"
-        
+        unique_ids = list(dict.fromkeys(tag_ids))
+
         # The 'include' parameter can take a list of up to 100 IDs.
-        # We chunk the requests to handle more than 100.
-        for i in range(0, len(unique_ids), 100):
-            chunk = unique_ids[i:i + 100]
-            params = {
-                "include": ",".join(map(str, chunk)),
-                "per_page": 100, # Ensure we get all requested items in the chunk
-                "_fields": "id,name"
-            }
-            try:
-                logger.info(f"Fetching names for {len(chunk)} tag IDs...")
-                r = self.session.get(endpoint, params=params, timeout=30)
-                r.raise_for_status()
-                tags_data = r.json()
+        # We chunk the requests to handle more than 100 and fetch the chunks concurrently;
+        # a failed chunk is skipped without affecting the others.
+        chunks = [unique_ids[i:i + 100] for i in range(0, len(unique_ids), 100)]
+        with ThreadPoolExecutor(max_workers=min(PAGE_FETCH_WORKERS, len(chunks))) as ex:
+            for tags_data in ex.map(self._fetch_tags_chunk, chunks):
                 for tag in tags_data:
                     tag_map[tag['id']] = tag['name']
-            except requests.RequestException as e:
-                logger.error(f"Error fetching tag details: {e}")
-                # Continue to next chunk even if one fails
-                continue
-        
+
         logger.info(f"Successfully mapped {len(tag_map)} tag IDs to names.")
         return tag_map
 
     def close(self):
-        """Closes the requests session."""
-        self.session.close()
\ No newline at end of file
+        """Persists the term ID caches and closes the requests sessions."""
+        self._save_term_cache()
+        self.session.close()
+        self._download_session.close()
\ No newline at end of file